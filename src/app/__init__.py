@@ -6,11 +6,12 @@ Exports the main `run_analysis` function.
 
 import os
 import pandas as pd
+import matplotlib.pyplot as plt
 
 # Import core components
 from .data.constants import ROUTES, CARBON_EMISSIONS, ACCOMMODATION, SCENARIOS
 from .calculations.analysis import calculate_route_metrics, analyze_scenarios, generate_key_findings
-from .visualization.plotting import setup_visualization_directory, plot_carbon_footprint_comparison, plot_carbon_per_vacation_day, plot_time_distribution, plot_cost_comparison, plot_carbon_breakdown, create_dashboard
+from .visualization.plotting import setup_visualization_directory, split_feasible_results, build_carbon_pivot, plot_carbon_footprint_comparison, plot_carbon_per_vacation_day, plot_time_distribution, plot_cost_comparison, plot_carbon_breakdown, create_dashboard
 from .presentation.generate_pptx import generate_presentation # <-- Import the new function
 
 # Define the output directory for results
@@ -36,33 +37,38 @@ def main():
 
     # 4. Save detailed results to CSV
     results_path = os.path.join(RESULTS_DIR, RESULTS_FILENAME)
-    df_results.to_csv(results_path, index=False)
+    with open(results_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        df_results.to_csv(f, index=False, lineterminator='\n')
     print(f"\nDetailed analysis results saved to: {results_path}")
 
     # 5. Generate Key Findings
     key_findings = generate_key_findings(df_results)
     print("\n--- Key Findings ---")
-    for finding in key_findings:
+    for finding in key_findings.lines:
         print(finding)
     # Save findings to a text file
     findings_path = os.path.join(RESULTS_DIR, FINDINGS_FILENAME)
-    with open(findings_path, 'w') as f:
-        f.write("Key Findings from Eco-Travel Analysis (Grenoble to Abuja):\n")
-        f.write("===========================================================\n\n")
-        for finding in key_findings:
-            f.write(f"- {finding}\n")
+    findings_text = ("Key Findings from Eco-Travel Analysis (Grenoble to Abuja):\n"
+                     "===========================================================\n\n"
+                     + "".join(f"- {finding}\n" for finding in key_findings.lines))
+    with open(findings_path, 'w', buffering=1 << 20) as f:
+        f.write(findings_text)
     print(f"\nKey findings saved to: {findings_path}")
 
 
     # 6. Generate Visualizations
     print("\nGenerating visualizations...")
-    plot_carbon_footprint_comparison(df_results)
-    plot_carbon_per_vacation_day(df_results)
-    plot_time_distribution(df_results)
-    plot_cost_comparison(df_results, accommodation_type='Hostel') # Example for Hostel
-    plot_cost_comparison(df_results, accommodation_type='Airbnb') # Example for Airbnb
-    plot_carbon_breakdown(routes_with_metrics)
-    # create_dashboard(df_results, routes_with_metrics) # Optional: Dashboard generation
+    feasible_df, feasible_unique_df = split_feasible_results(df_results)
+    fig = plt.figure() # Reused by every plot below
+    plot_carbon_footprint_comparison(feasible_unique_df, fig=fig)
+    plot_carbon_per_vacation_day(feasible_unique_df, fig=fig)
+    plot_time_distribution(feasible_unique_df, fig=fig)
+    plot_cost_comparison(feasible_df, accommodation_type='Hostel', fig=fig) # Example for Hostel
+    plot_cost_comparison(feasible_df, accommodation_type='Airbnb', fig=fig) # Example for Airbnb
+    pivot_df = build_carbon_pivot(routes_with_metrics)
+    plot_carbon_breakdown(pivot_df, fig=fig)
+    plt.close(fig)
+    # create_dashboard(feasible_df, feasible_unique_df, pivot_df) # Optional: Dashboard generation
 
     # 7. Generate PowerPoint Presentation
     print("\nGenerating PowerPoint presentation...")
@@ -3,9 +3,10 @@ Performs the core calculations for the travel analysis, including
 carbon footprint, cost estimation, and feasibility checks.
 """
 
+from dataclasses import dataclass, field
 import numpy as np
 import pandas as pd
-from math import radians, cos, sin, asin, sqrt
+from math import radians, cos, sin, asin, sqrt, ceil
 from ..data.constants import CARBON_EMISSIONS, ROUTES, ACCOMMODATION, SCENARIOS
 
 def haversine(lat1, lon1, lat2, lon2):
@@ -33,37 +34,79 @@ def haversine(lat1, lon1, lat2, lon2):
     r = 6371  # Radius of earth in kilometers
     return c * r
 
-def calculate_route_metrics(routes, carbon_emissions):
-    """Calculates total distance and carbon footprint for each route.
+def haversine_array(lat1, lon1, lat2, lon2):
+    """
+    Vectorized version of `haversine` for arrays of coordinate pairs.
 
     Args:
-        routes (dict): Dictionary containing route data.
-        carbon_emissions (dict): Dictionary of carbon emissions per mode.
+        lat1 (array_like): Latitudes of the first points.
+        lon1 (array_like): Longitudes of the first points.
+        lat2 (array_like): Latitudes of the second points.
+        lon2 (array_like): Longitudes of the second points.
 
     Returns:
-        dict: Updated routes dictionary with calculated metrics.
+        np.ndarray: Distances in kilometers, one per coordinate pair.
     """
-    print("\nCalculating route metrics...")
-    for route_name, route_data in routes.items():
-        total_carbon = 0
-        total_distance = 0
-
-        for segment in route_data['segments']:
-            mode = segment['mode']
-            distance = segment['distance']
-            total_distance += distance
-            # Calculate carbon in kg CO2e
-            carbon = (distance * carbon_emissions[mode]) / 1000
+    # Convert decimal degrees to radians
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+
+    # Haversine formula
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
+    r = 6371  # Radius of earth in kilometers
+    return c * r
+
+def _emission_lookup(carbon_emissions):
+    """Returns the mode-id mapping and emission factor array for `carbon_emissions`."""
+    mode_ids = {mode: i for i, mode in enumerate(carbon_emissions)}
+    factors = np.array(list(carbon_emissions.values()), dtype=np.float32)
+    return mode_ids, factors
+
+def _calculate_route_metrics_core(routes, carbon_emissions):
+    """Computes the route metrics of `calculate_route_metrics` without any output."""
+    mode_ids, factors = _emission_lookup(carbon_emissions)
+    for route_data in routes.values():
+        segments = route_data['segments']
+        n = len(segments)
+        # Segment distances and mode ids as parallel arrays
+        distances = np.fromiter((s['distance'] for s in segments), dtype=np.float64, count=n)
+        modes = np.fromiter((mode_ids[s['mode']] for s in segments), dtype=np.intp, count=n)
+        # Calculate carbon in kg CO2e
+        carbons = distances * factors[modes] * 1e-3
+        for segment, carbon in zip(segments, carbons.tolist()):
             segment['carbon'] = carbon
-            total_carbon += carbon
+
+        total_carbon = carbons.sum().item()
+        total_distance = sum(s['distance'] for s in segments)
 
         route_data['total_carbon_one_way'] = total_carbon
         route_data['total_carbon_round_trip'] = total_carbon * 2
         route_data['total_distance'] = total_distance
+    return routes
+
+def calculate_route_metrics(routes, carbon_emissions):
+    """Calculates total distance and carbon footprint for each route.
+
+    Args:
+        routes (dict): Dictionary containing route data.
+        carbon_emissions (dict): Dictionary of carbon emissions per mode.
 
-        print(f"  {route_name}: Distance={total_distance} km, Carbon (one-way)={total_carbon:.1f} kg CO2e")
+    Returns:
+        dict: Updated routes dictionary with calculated metrics.
+    """
+    routes = _calculate_route_metrics_core(routes, carbon_emissions)
+    report = "\n".join(
+        f"  {route_name}: Distance={route_data['total_distance']} km, Carbon (one-way)={route_data['total_carbon_one_way']:.1f} kg CO2e"
+        for route_name, route_data in routes.items())
+    print(f"\nCalculating route metrics...\n{report}")
     return routes
 
+# Possible values of the 'Feasibility' results column, and their category codes
+FEASIBILITY_LEVELS = ("Feasible", "Not feasible")
+FEASIBLE_CODE, NOT_FEASIBLE_CODE = 0, 1
+
 def analyze_scenarios(routes, accommodation, scenarios):
     """Analyzes travel scenarios based on routes, accommodation, and duration.
 
@@ -76,50 +119,90 @@ def analyze_scenarios(routes, accommodation, scenarios):
         pd.DataFrame: DataFrame containing the results of the scenario analysis.
     """
     print("\nAnalyzing scenarios...")
-    results = []
-    for scenario_name, scenario_data in scenarios.items():
-        total_days = scenario_data['days']
+    accommodation_items = tuple(accommodation.items())
+    scenario_items = tuple((name, scenario['days']) for name, scenario in scenarios.items())
+    n = len(scenario_items) * len(routes) * len(accommodation_items)
+    # One preallocated buffer per output column; NaN marks missing values.
+    # Identifier columns hold category codes, decoded into pd.Categorical at the end.
+    scenario_codes = np.empty(n, dtype=np.int16)
+    route_codes = np.empty(n, dtype=np.int16)
+    accom_codes = np.empty(n, dtype=np.int16)
+    travel_days_col = np.full(n, np.nan, dtype=np.float32)
+    days_dest_col = np.empty(n, dtype=np.int16)
+    carbon_col = np.empty(n, dtype=np.float32)
+    carbon_per_day_col = np.full(n, np.nan, dtype=np.float32)
+    cost_col = np.full(n, np.nan, dtype=np.float32)
+    feasibility_codes = np.empty(n, dtype=np.int8)
+
+    # Scenario-invariant quantities, computed once per route
+    route_cache = {}
+    for route_name, route_data in routes.items():
+        # Calculate travel time in days (rounding up)
+        travel_days_one_way = ceil(route_data['travel_time_hours'] / 24)
+        route_cache[route_name] = (travel_days_one_way * 2,
+                                   route_data['total_carbon_round_trip'],
+                                   route_data['cost_eur'])
+
+    i = 0
+    for scenario_code, (scenario_name, total_days) in enumerate(scenario_items):
         print(f"  Scenario: {scenario_name} ({total_days} days)")
 
-        for route_name, route_data in routes.items():
-            # Calculate travel time in days (rounding up)
-            travel_days_one_way = np.ceil(route_data['travel_time_hours'] / 24)
-            travel_days_round = travel_days_one_way * 2
+        for route_code, (travel_days_round, carbon_round_trip, route_cost) in enumerate(route_cache.values()):
             days_at_destination = total_days - travel_days_round
 
             # Determine feasibility and carbon efficiency
-            if days_at_destination <= 0:
-                feasibility = "Not feasible"
-                carbon_per_vacation_day = None
+            feasible = days_at_destination > 0
+            if not feasible:
+                carbon_per_vacation_day = np.nan
                 days_at_destination_calc = 0 # Use 0 for calculations if not feasible
             else:
-                feasibility = "Feasible"
-                carbon_per_vacation_day = route_data['total_carbon_round_trip'] / days_at_destination
+                carbon_per_vacation_day = carbon_round_trip / days_at_destination
                 days_at_destination_calc = days_at_destination
 
             # Calculate costs for each accommodation type
-            for accom_name, accom_cost in accommodation.items():
-                if feasibility == "Feasible":
-                    total_cost = route_data['cost_eur'] + (days_at_destination_calc * accom_cost)
-                else:
-                    total_cost = None # No cost if the trip isn't feasible
-
-                results.append({
-                    'Scenario': scenario_name,
-                    'Route': route_name,
-                    'Accommodation': accom_name,
-                    'Travel Days (Round Trip)': travel_days_round if feasibility == "Feasible" else None,
-                    'Days at Destination': days_at_destination_calc,
-                    'Carbon Footprint (kg CO2e)': route_data['total_carbon_round_trip'],
-                    'Carbon per Vacation Day': carbon_per_vacation_day,
-                    'Total Cost (EUR)': total_cost,
-                    'Feasibility': feasibility
-                })
-
-    df_results = pd.DataFrame(results)
+            for accom_code, (_, accom_cost) in enumerate(accommodation_items):
+                scenario_codes[i] = scenario_code
+                route_codes[i] = route_code
+                accom_codes[i] = accom_code
+                days_dest_col[i] = days_at_destination_calc
+                carbon_col[i] = carbon_round_trip
+                carbon_per_day_col[i] = carbon_per_vacation_day
+                feasibility_codes[i] = FEASIBLE_CODE if feasible else NOT_FEASIBLE_CODE
+                if feasible:
+                    travel_days_col[i] = travel_days_round
+                    cost_col[i] = route_cost + (days_at_destination_calc * accom_cost)
+                # Otherwise travel days and cost stay NaN: the trip isn't feasible
+                i += 1
+
+    df_results = pd.DataFrame({
+        'Scenario': pd.Categorical.from_codes(scenario_codes, [name for name, _ in scenario_items]),
+        'Route': pd.Categorical.from_codes(route_codes, list(route_cache)),
+        'Accommodation': pd.Categorical.from_codes(accom_codes, [name for name, _ in accommodation_items]),
+        'Travel Days (Round Trip)': travel_days_col,
+        'Days at Destination': days_dest_col,
+        'Carbon Footprint (kg CO2e)': carbon_col,
+        'Carbon per Vacation Day': carbon_per_day_col,
+        'Total Cost (EUR)': cost_col,
+        'Feasibility': pd.Categorical.from_codes(feasibility_codes, FEASIBILITY_LEVELS)
+    })
     print("Scenario analysis complete.")
     return df_results
 
+@dataclass
+class Findings:
+    """Key findings of the analysis.
+
+    Attributes:
+        lines (list): Formatted summary lines, in report order.
+        recommendations (list): Recommendation sentences, without list markers.
+        week_routes (list): Routes feasible for the 1-week scenario.
+        month_best (str or None): Lowest-carbon feasible route for the 1-month scenario, if any.
+    """
+    lines: list = field(default_factory=list)
+    recommendations: list = field(default_factory=list)
+    week_routes: list = field(default_factory=list)
+    month_best: str | None = None
+
 def generate_key_findings(df_results):
     """Generates a summary of key findings from the analysis results.
 
@@ -127,17 +210,26 @@ def generate_key_findings(df_results):
         df_results (pd.DataFrame): DataFrame with analysis results.
 
     Returns:
-        list: A list of strings summarizing the key findings.
+        Findings: The summary lines along with the recommendations and routes they are built from.
     """
     findings = []
     feasible_results = df_results[df_results['Feasibility'] == 'Feasible'] # Filter for feasible options first
 
     if feasible_results.empty:
         findings.append("No feasible travel options found for the given scenarios.")
-        return findings
+        return Findings(lines=findings)
+
+    # Per-route and per-scenario aggregates, computed in one pass each
+    route_agg = feasible_results.groupby('Route', observed=True).agg(
+        carbon_mean=('Carbon Footprint (kg CO2e)', 'mean'))
+    scenario_route_agg = feasible_results.groupby(['Scenario', 'Route'], observed=True).agg(
+        cpd_mean=('Carbon per Vacation Day', 'mean'))
+    feasible_by_scn = {scenario: np.asarray(routes)
+                       for scenario, routes in feasible_results.groupby('Scenario', observed=True)['Route'].unique().items()}
+    no_routes = np.array([], dtype=object)
 
     # 1. Comparing carbon emissions
-    avg_carbon = feasible_results.groupby('Route')['Carbon Footprint (kg CO2e)'].mean()
+    avg_carbon = route_agg['carbon_mean']
     if not avg_carbon.empty:
         best_carbon_route = avg_carbon.idxmin()
         worst_carbon_route = avg_carbon.idxmax()
@@ -152,16 +244,15 @@ def generate_key_findings(df_results):
                  findings.append(f"   - This is {carbon_reduction:.1f}% less than 'Air Travel' ({air_carbon:.1f} kg CO2e)." )
 
     # 2. Feasibility for 1-week
-    feasible_week = feasible_results[feasible_results['Scenario'] == '1-week']['Route'].unique()
+    feasible_week = feasible_by_scn.get('1-week', no_routes)
     if feasible_week.size > 0:
         findings.append(f"2. 1-Week Feasibility: Only these routes are feasible for a 1-week trip: {', '.join(feasible_week)}.")
     else:
         findings.append("2. 1-Week Feasibility: No routes are feasible for a 1-week trip.")
 
     # 3. Carbon efficiency for 1-month
-    month_results = feasible_results[(feasible_results['Scenario'] == '1-month') & (feasible_results['Carbon per Vacation Day'].notna())]
-    if not month_results.empty:
-        avg_carbon_per_day = month_results.groupby('Route')['Carbon per Vacation Day'].mean()
+    if '1-month' in feasible_by_scn:
+        avg_carbon_per_day = scenario_route_agg.loc['1-month', 'cpd_mean'].dropna()
         if not avg_carbon_per_day.empty:
             best_carbon_per_day_route = avg_carbon_per_day.idxmin()
             findings.append(f"3. 1-Month Carbon Efficiency: '{best_carbon_per_day_route}' has the lowest carbon footprint per day at the destination ({avg_carbon_per_day.min():.1f} kg CO2e/day)." )
@@ -171,31 +262,39 @@ def generate_key_findings(df_results):
     # 4. Cost comparison (using Hostel for consistency)
     hostel_costs = feasible_results[feasible_results['Accommodation'] == 'Hostel']
     if not hostel_costs.empty:
-        cheapest_options = hostel_costs.loc[hostel_costs.groupby(['Scenario'])['Total Cost (EUR)'].idxmin()]
+        cheapest_idx = hostel_costs.groupby('Scenario', observed=True)['Total Cost (EUR)'].idxmin()
+        cheapest_options = hostel_costs.loc[cheapest_idx, ['Scenario', 'Route', 'Total Cost (EUR)']]
         findings.append("4. Cheapest Options (Hostel Accommodation):")
-        for _, row in cheapest_options.iterrows():
-            findings.append(f"   - {row['Scenario']}: '{row['Route']}' at approximately €{row['Total Cost (EUR)']:.0f}.")
+        for scenario, route, cost in cheapest_options.itertuples(index=False, name=None):
+            findings.append(f"   - {scenario}: '{route}' at approximately €{cost:.0f}.")
     else:
         findings.append("4. Cheapest Options: Could not determine cheapest options (no feasible hostel data).")
 
     # 5. Recommendations
-    findings.append("5. Environmental Recommendation Summary:")
+    recommendations = []
     if feasible_week.size > 0:
         # Recommend the lowest carbon option among the feasible ones for 1 week
         week_carbon = avg_carbon[avg_carbon.index.isin(feasible_week)]
         if not week_carbon.empty:
             best_week_route = week_carbon.idxmin()
-            findings.append(f"   - 1-week vacation: '{best_week_route}' (lowest carbon among feasible options)." )
+            recommendations.append(f"1-week vacation: '{best_week_route}' (lowest carbon among feasible options)." )
         else:
-             findings.append("   - 1-week vacation: No recommendation possible (no feasible carbon data).")
+             recommendations.append("1-week vacation: No recommendation possible (no feasible carbon data).")
     else:
-        findings.append("   - 1-week vacation: No feasible options.")
+        recommendations.append("1-week vacation: No feasible options.")
 
-    month_carbon = avg_carbon[avg_carbon.index.isin(feasible_results[feasible_results['Scenario'] == '1-month']['Route'].unique())]
+    best_month_route = None
+    month_carbon = avg_carbon[avg_carbon.index.isin(feasible_by_scn.get('1-month', no_routes))]
     if not month_carbon.empty:
         best_month_route = month_carbon.idxmin()
-        findings.append(f"   - 1-month vacation: '{best_month_route}' (lowest overall carbon footprint among feasible options)." )
+        recommendations.append(f"1-month vacation: '{best_month_route}' (lowest overall carbon footprint among feasible options)." )
     else:
-        findings.append("   - 1-month vacation: No feasible options.")
+        recommendations.append("1-month vacation: No feasible options.")
+
+    findings.append("5. Environmental Recommendation Summary:")
+    findings.extend(f"   - {reco}" for reco in recommendations)
 
-    return findings
\ No newline at end of file
+    return Findings(lines=findings,
+                    recommendations=recommendations,
+                    week_routes=list(feasible_week),
+                    month_best=best_month_route)
\ No newline at end of file
@@ -13,6 +13,44 @@ import pandas as pd
 PPTX_DIR = "results"
 PPTX_FILENAME = "eco_travel_analysis_presentation.pptx"
 
+# Slide geometry, converted to EMU once at import
+_SLIDE_WIDTH_IN = 16
+_SLIDE_HEIGHT_IN = 9
+_TITLE_LEFT = Inches(0.5)
+_TITLE_TOP = Inches(0.2)
+_TITLE_WIDTH = Inches(9)
+_TITLE_HEIGHT = Inches(0.8)
+_IMG_WIDTH_IN = 8 # Desired image width in inches
+_IMG_HEIGHT_IN = 5 # Desired image height in inches
+_IMG_WIDTH = Inches(_IMG_WIDTH_IN)
+_IMG_HEIGHT = Inches(_IMG_HEIGHT_IN)
+_IMG_TOP = Inches(1.2) # Position below title
+_PLACEHOLDER_LEFT = Inches(1)
+_PLACEHOLDER_TOP = Inches(2)
+_PLACEHOLDER_WIDTH = Inches(8)
+_PLACEHOLDER_HEIGHT = Inches(1)
+_PLACEHOLDER_RED = RGBColor(255, 0, 0)
+
+# Image slides (title, visualization file, speaker notes), in presentation order
+_VIZ_DIR = os.path.join("results", "visualizations")
+IMAGE_SLIDES = (
+    ("Carbon Footprint Comparison (Round Trip)",
+     "carbon_footprint_comparison.png",
+     "This chart compares the total CO2 equivalent emissions for each route under both scenarios. Note the significant difference between air travel and the land/sea options."),
+    ("Carbon Footprint Breakdown (One-Way)",
+     "carbon_breakdown.png",
+     "This shows which modes of transport contribute most to the carbon footprint for each route. For air travel, the flight itself dominates. For others, contributions are more varied."),
+    ("Time Distribution: Travel vs. Destination",
+     "time_distribution.png",
+     "This visualizes how total vacation time is split between traveling and being at the destination. Overland routes consume much more travel time, making them infeasible for the 1-week scenario."),
+    ("Carbon Footprint per Vacation Day",
+     "carbon_per_vacation_day.png",
+     "This metric shows the carbon 'cost' per day actually spent enjoying the destination. Longer trips with low-carbon transport become much more efficient by this measure."),
+    ("Total Cost Comparison (Hostel)",
+     "cost_comparison_hostel.png",
+     "Compares the estimated total trip cost (transport + hostel accommodation) for feasible options. Costs are relatively similar for the 1-month scenario across different routes."),
+)
+
 def setup_presentation_directory():
     """Creates the presentation output directory if it doesn't exist."""
     if not os.path.exists(PPTX_DIR):
@@ -58,7 +96,7 @@ def add_content_slide(prs, title, content_list):
         p.level = 0 # Top level bullet
         p.font.size = Pt(18)
 
-def add_image_slide(prs, title, image_path, notes=""):
+def add_image_slide(prs, title, image_path, notes="", left=None, image_exists=None):
     """Adds a slide with a title and an image.
 
     Args:
@@ -66,12 +104,16 @@ def add_image_slide(prs, title, image_path, notes=""):
         title (str): The title for the slide.
         image_path (str): Path to the image file.
         notes (str, optional): Speaker notes for the slide. Defaults to "".
+        left (Length, optional): Left offset of the image. Defaults to
+            centering it on the slide.
+        image_exists (bool, optional): Whether the image file exists, if
+            already known. Defaults to checking the filesystem.
     """
     blank_slide_layout = prs.slide_layouts[6] # Blank layout
     slide = prs.slides.add_slide(blank_slide_layout)
 
     # Add title
-    title_shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(0.8))
+    title_shape = slide.shapes.add_textbox(_TITLE_LEFT, _TITLE_TOP, _TITLE_WIDTH, _TITLE_HEIGHT)
     tf = title_shape.text_frame
     p = tf.add_paragraph()
     p.text = title
@@ -80,20 +122,20 @@ def add_image_slide(prs, title, image_path, notes=""):
     p.alignment = PP_ALIGN.CENTER
 
     # Add image, centered
-    if os.path.exists(image_path):
-        img_width_in = 8 # Desired image width in inches
-        img_height_in = 5 # Desired image height in inches
-        left = (prs.slide_width.inches - img_width_in) / 2
-        top = Inches(1.2) # Position below title
-        slide.shapes.add_picture(image_path, left, top, width=Inches(img_width_in), height=Inches(img_height_in))
+    if image_exists is None:
+        image_exists = os.path.exists(image_path)
+    if image_exists:
+        if left is None:
+            left = Inches((prs.slide_width.inches - _IMG_WIDTH_IN) / 2)
+        slide.shapes.add_picture(image_path, left, _IMG_TOP, width=_IMG_WIDTH, height=_IMG_HEIGHT)
     else:
         print(f"Warning: Image not found at {image_path}")
         # Add a placeholder text if image is missing
-        txt_box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
+        txt_box = slide.shapes.add_textbox(_PLACEHOLDER_LEFT, _PLACEHOLDER_TOP, _PLACEHOLDER_WIDTH, _PLACEHOLDER_HEIGHT)
         tf = txt_box.text_frame
         p = tf.add_paragraph()
         p.text = f"Image not found: {os.path.basename(image_path)}"
-        p.font.color.rgb = RGBColor(255, 0, 0) # Red text
+        p.font.color.rgb = _PLACEHOLDER_RED # Red text
         p.alignment = PP_ALIGN.CENTER
 
     # Add speaker notes if provided
@@ -107,13 +149,18 @@ def generate_presentation(df_results, key_findings, routes):
 
     Args:
         df_results (pd.DataFrame): DataFrame containing the scenario analysis results.
-        key_findings (list): List of strings summarizing key findings.
+        key_findings (Findings): Key findings from `generate_key_findings`.
         routes (dict): Dictionary containing route details.
     """
     setup_presentation_directory()
     prs = Presentation()
-    prs.slide_width = Inches(16)
-    prs.slide_height = Inches(9)
+    prs.slide_width = Inches(_SLIDE_WIDTH_IN)
+    prs.slide_height = Inches(_SLIDE_HEIGHT_IN)
+    # Images are centered horizontally on every image slide
+    img_left = Inches((_SLIDE_WIDTH_IN - _IMG_WIDTH_IN) / 2)
+    # Check all images up front
+    viz_paths = [os.path.join(_VIZ_DIR, filename) for _, filename, _ in IMAGE_SLIDES]
+    viz_exists = [os.path.exists(path) for path in viz_paths]
 
     # --- Slide 1: Title ---
     add_title_slide(prs,
@@ -136,46 +183,15 @@ def generate_presentation(df_results, key_findings, routes):
         options_content.append(f"{name}: ~{data['travel_time_hours']:.0f} hrs one-way, {data['total_carbon_one_way']:.1f} kg CO2e one-way, €{data['cost_eur']/2:.0f} one-way")
     add_content_slide(prs, "Transportation Options Overview", options_content)
 
-    # --- Slide 4: Carbon Footprint Comparison Plot ---
-    carbon_plot_path = os.path.join("results", "visualizations", "carbon_footprint_comparison.png")
-    add_image_slide(prs, "Carbon Footprint Comparison (Round Trip)", carbon_plot_path,
-                    notes="This chart compares the total CO2 equivalent emissions for each route under both scenarios. Note the significant difference between air travel and the land/sea options.")
-
-    # --- Slide 5: Carbon Breakdown Plot ---
-    breakdown_plot_path = os.path.join("results", "visualizations", "carbon_breakdown.png")
-    add_image_slide(prs, "Carbon Footprint Breakdown (One-Way)", breakdown_plot_path,
-                    notes="This shows which modes of transport contribute most to the carbon footprint for each route. For air travel, the flight itself dominates. For others, contributions are more varied.")
-
-    # --- Slide 6: Time Efficiency & Feasibility ---
-    time_plot_path = os.path.join("results", "visualizations", "time_distribution.png")
-    add_image_slide(prs, "Time Distribution: Travel vs. Destination", time_plot_path,
-                    notes="This visualizes how total vacation time is split between traveling and being at the destination. Overland routes consume much more travel time, making them infeasible for the 1-week scenario.")
-
-    # --- Slide 7: Carbon per Vacation Day Plot ---
-    carbon_per_day_plot_path = os.path.join("results", "visualizations", "carbon_per_vacation_day.png")
-    add_image_slide(prs, "Carbon Footprint per Vacation Day", carbon_per_day_plot_path,
-                    notes="This metric shows the carbon 'cost' per day actually spent enjoying the destination. Longer trips with low-carbon transport become much more efficient by this measure.")
-
-    # --- Slide 8: Cost Comparison (Hostel) Plot ---
-    cost_hostel_plot_path = os.path.join("results", "visualizations", "cost_comparison_hostel.png")
-    add_image_slide(prs, "Total Cost Comparison (Hostel)", cost_hostel_plot_path,
-                    notes="Compares the estimated total trip cost (transport + hostel accommodation) for feasible options. Costs are relatively similar for the 1-month scenario across different routes.")
+    # --- Slides 4-8: Visualization plots ---
+    for (title, _, notes), image_path, image_exists in zip(IMAGE_SLIDES, viz_paths, viz_exists):
+        add_image_slide(prs, title, image_path, notes=notes, left=img_left, image_exists=image_exists)
 
     # --- Slide 9: Key Findings / Summary ---
-    add_content_slide(prs, "Key Findings", key_findings)
+    add_content_slide(prs, "Key Findings", key_findings.lines)
 
     # --- Slide 10: Recommendations ---
-    reco_content = []
-    # Extract recommendations from findings (assuming they are the last items)
-    reco_start_index = -1
-    for i, finding in enumerate(key_findings):
-        if finding.startswith("5. Environmental Recommendation Summary:"):
-            reco_start_index = i
-            break
-    if reco_start_index != -1:
-        reco_content = [f.replace("   - ", "") for f in key_findings[reco_start_index+1:]]
-    else:
-        reco_content = ["Recommendations could not be automatically extracted."]
+    reco_content = key_findings.recommendations or ["No recommendations available (no feasible travel options)."]
 
     add_content_slide(prs, "Recommendations", reco_content)
 
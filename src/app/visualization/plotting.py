@@ -2,77 +2,140 @@
 Generates visualizations for the travel analysis results.
 """
 
+import io
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg") # Non-interactive backend: plots are only saved to files, possibly from worker processes
 import matplotlib.pyplot as plt
 import seaborn as sns
 import matplotlib.ticker as ticker
 
+# Set global plot styles once, at import (this also covers worker processes)
+sns.set_style("whitegrid")
+plt.rcParams.update({'font.family': 'DejaVu Sans', 'font.size': 12})
+
 # Define the output directory for plots
 VIZ_DIR = "results/visualizations"
 
+# Colors for the two scenarios and for the transport modes of the breakdown plots
+SCENARIO_PALETTE = ('#ff7675', '#74b9ff')
+MODE_PALETTE = ('#fdcb6e', '#0984e3', '#00b894', '#6c5ce7', '#e17055', '#fab1a0')
+
+# Options shared by every savefig call; PNG compression level 5 encodes slightly faster than
+# the default 6 for about the same file size (levels 4 and below nearly double the file size)
+SAVEFIG_KWARGS = dict(dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 5})
+
 def setup_visualization_directory():
     """Creates or clears the visualization output directory."""
     if os.path.exists(VIZ_DIR):
-        # Clear existing contents
-        for filename in os.listdir(VIZ_DIR):
-            file_path = os.path.join(VIZ_DIR, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                print(f'Failed to delete {file_path}. Reason: {e}')
+        # Clear existing contents; DirEntry caches the file type from the directory listing
+        with os.scandir(VIZ_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except Exception as e:
+                    print(f'Failed to delete {entry.path}. Reason: {e}')
     else:
         # Create the directory if it doesn't exist
         os.makedirs(VIZ_DIR)
     print(f"Visualization directory '{VIZ_DIR}' is ready.")
 
-def format_thousands(x, pos):
-    """Format tick labels with thousands separator."""
-    return f'{int(x):,}'
+def save_current_figure(save_path):
+    """Renders the current figure to PNG in memory, then writes it to `save_path` in one write."""
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', **SAVEFIG_KWARGS)
+    with open(save_path, 'wb', buffering=1 << 20) as f:
+        f.write(buf.getbuffer())
+
+def _get_figure(fig, figsize):
+    """Returns a blank figure of `figsize`, made current for pyplot.
+
+    `fig` is cleared and reused if given, otherwise a new figure is created.
+    The second value tells whether the caller owns (and must close) the figure.
+    """
+    if fig is None:
+        return plt.figure(figsize=figsize), True
+    fig.clear()
+    fig.set_size_inches(figsize)
+    plt.figure(fig.number)
+    return fig, False
+
+def _release_figure(fig, owns_fig):
+    """Closes `fig` if it was created by `_get_figure`; reused figures stay open."""
+    if owns_fig:
+        plt.close(fig)
+
+def _drop_unused_categories(df):
+    """Returns `df` with unused categories removed from its categorical columns.
+
+    Seaborn draws a slot for every category, so this keeps plots to the routes
+    and scenarios actually present in `df`.
+    """
+    categorical_columns = df.select_dtypes('category').columns
+    return df.assign(**{col: df[col].cat.remove_unused_categories() for col in categorical_columns})
+
+def split_feasible_results(df_results):
+    """Selects the feasible results once for all plots.
+
+    Args:
+        df_results (pd.DataFrame): DataFrame with analysis results.
 
-def plot_carbon_footprint_comparison(df_results):
+    Returns:
+        tuple: The feasible rows, and the feasible rows with one row per (Route, Scenario) pair.
+    """
+    feasible_df = _drop_unused_categories(df_results[df_results['Feasibility'].values == 'Feasible'])
+    # Keep only the columns the plots read before deduplicating
+    feasible_unique_df = feasible_df[['Route', 'Scenario', 'Carbon Footprint (kg CO2e)', 'Carbon per Vacation Day',
+                                      'Travel Days (Round Trip)', 'Days at Destination', 'Total Cost (EUR)',
+                                      'Accommodation']].drop_duplicates(subset=['Route', 'Scenario'], ignore_index=True)
+    return feasible_df, feasible_unique_df
+
+def plot_carbon_footprint_comparison(feasible_unique_df, fig=None):
     """Plots the comparison of carbon footprints by route and scenario."""
-    plt.figure(figsize=(12, 8))
-    carbon_data = df_results[df_results['Feasibility'] == 'Feasible'].drop_duplicates(subset=['Route', 'Scenario'])
+    fig, owns_fig = _get_figure(fig, (12, 8))
+    carbon_data = feasible_unique_df
     if carbon_data.empty:
         print("Skipping carbon footprint plot: No feasible data.")
-        plt.close()
+        _release_figure(fig, owns_fig)
         return
 
+    ax = fig.add_subplot(111)
     sns.barplot(x='Route', y='Carbon Footprint (kg CO2e)',
                 hue='Scenario', data=carbon_data,
-                palette=['#ff7675', '#74b9ff'])
+                palette=SCENARIO_PALETTE, ax=ax)
     plt.title('Carbon Footprint by Route and Scenario', fontsize=16)
     plt.ylabel('Carbon Footprint (kg CO2e)', fontsize=14)
     plt.xlabel('Route', fontsize=14)
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     plt.legend(title='Scenario')
     plt.xticks(rotation=0)
-    plt.gca().yaxis.set_major_formatter(ticker.FuncFormatter(format_thousands))
+    ax.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
     plt.tight_layout()
     save_path = os.path.join(VIZ_DIR, 'carbon_footprint_comparison.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_current_figure(save_path)
     print(f"Plot saved: {save_path}")
-    plt.close()
+    _release_figure(fig, owns_fig)
 
-def plot_carbon_per_vacation_day(df_results):
+def plot_carbon_per_vacation_day(feasible_unique_df, fig=None):
     """Plots the carbon footprint per vacation day."""
-    plt.figure(figsize=(12, 8))
-    carbon_per_day_data = df_results[(df_results['Feasibility'] == 'Feasible') &
-                                     (df_results['Carbon per Vacation Day'].notna())].drop_duplicates(subset=['Route', 'Scenario'])
+    fig, owns_fig = _get_figure(fig, (12, 8))
+    carbon_per_day_data = feasible_unique_df.dropna(subset=['Carbon per Vacation Day'])
     if carbon_per_day_data.empty:
         print("Skipping carbon per day plot: No feasible data.")
-        plt.close()
+        _release_figure(fig, owns_fig)
         return
 
+    ax = fig.add_subplot(111)
     sns.barplot(x='Route', y='Carbon per Vacation Day',
                 hue='Scenario', data=carbon_per_day_data,
-                palette=['#ff7675', '#74b9ff'])
+                palette=SCENARIO_PALETTE, ax=ax)
     plt.title('Carbon Footprint per Vacation Day', fontsize=16)
     plt.ylabel('kg CO2e per Day at Destination', fontsize=14)
     plt.xlabel('Route', fontsize=14)
@@ -81,13 +144,13 @@ def plot_carbon_per_vacation_day(df_results):
     plt.xticks(rotation=0)
     plt.tight_layout()
     save_path = os.path.join(VIZ_DIR, 'carbon_per_vacation_day.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_current_figure(save_path)
     print(f"Plot saved: {save_path}")
-    plt.close()
+    _release_figure(fig, owns_fig)
 
-def plot_time_distribution(df_results):
+def plot_time_distribution(feasible_unique_df, fig=None):
     """Plots the distribution of travel days vs. days at destination."""
-    time_data = df_results[df_results['Feasibility'] == 'Feasible'].drop_duplicates(subset=['Route', 'Scenario'])
+    time_data = feasible_unique_df
     if time_data.empty:
         print("Skipping time distribution plot: No feasible data.")
         return
@@ -95,7 +158,8 @@ def plot_time_distribution(df_results):
     x = np.arange(len(time_data))
     width = 0.35
 
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, owns_fig = _get_figure(fig, (12, 8))
+    ax = fig.add_subplot(111)
     ax.bar(x - width/2, time_data['Travel Days (Round Trip)'], width, label='Travel Days', color='#e17055')
     ax.bar(x + width/2, time_data['Days at Destination'], width, label='Days at Destination', color='#00b894')
 
@@ -103,118 +167,142 @@ def plot_time_distribution(df_results):
     ax.set_ylabel('Days', fontsize=14)
     ax.set_xticks(x)
     # Ensure labels are strings
-    ax.set_xticklabels([f"{row['Route']} ({row['Scenario']})" for _, row in time_data.iterrows()], rotation=45, ha='right')
+    tick_labels = (time_data['Route'].astype(str) + ' (' + time_data['Scenario'].astype(str) + ')').tolist()
+    ax.set_xticklabels(tick_labels, rotation=45, ha='right')
     ax.legend()
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     plt.tight_layout()
     save_path = os.path.join(VIZ_DIR, 'time_distribution.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_current_figure(save_path)
     print(f"Plot saved: {save_path}")
-    plt.close(fig)
+    _release_figure(fig, owns_fig)
 
-def plot_cost_comparison(df_results, accommodation_type='Hostel'):
+def plot_cost_comparison(feasible_df, accommodation_type='Hostel', fig=None):
     """Plots the total cost comparison for a specific accommodation type."""
-    plt.figure(figsize=(12, 8))
-    cost_data = df_results[(df_results['Feasibility'] == 'Feasible') &
-                          (df_results['Accommodation'] == accommodation_type)]
+    fig, owns_fig = _get_figure(fig, (12, 8))
+    cost_data = _drop_unused_categories(feasible_df[feasible_df['Accommodation'] == accommodation_type])
     if cost_data.empty:
         print(f"Skipping cost comparison plot ({accommodation_type}): No feasible data.")
-        plt.close()
+        _release_figure(fig, owns_fig)
         return
 
+    ax = fig.add_subplot(111)
     sns.barplot(x='Route', y='Total Cost (EUR)',
                 hue='Scenario', data=cost_data,
-                palette=['#ff7675', '#74b9ff'])
+                palette=SCENARIO_PALETTE, ax=ax)
     plt.title(f'Total Cost Comparison (with {accommodation_type} Accommodation)', fontsize=16)
     plt.ylabel('Total Cost (EUR)', fontsize=14)
     plt.xlabel('Route', fontsize=14)
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     plt.legend(title='Scenario')
     plt.xticks(rotation=0)
-    plt.gca().yaxis.set_major_formatter(ticker.FuncFormatter(format_thousands))
+    ax.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
     plt.tight_layout()
     save_path = os.path.join(VIZ_DIR, f'cost_comparison_{accommodation_type.lower()}.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_current_figure(save_path)
     print(f"Plot saved: {save_path}")
-    plt.close()
+    _release_figure(fig, owns_fig)
 
-def plot_carbon_breakdown(routes):
-    """Plots the carbon footprint breakdown by transport mode."""
-    plt.figure(figsize=(14, 10))
-    carbon_breakdown = []
-    for route_name, route_data in routes.items():
-        # Check if segments exist and have carbon data
-        if 'segments' in route_data and all('carbon' in seg for seg in route_data['segments']):
-            for segment in route_data['segments']:
-                carbon_breakdown.append({
-                    'Route': route_name,
-                    'Mode': segment['mode'],
-                    'Carbon (kg CO2e)': segment['carbon'] # One-way carbon
-                })
-        else:
-            print(f"Warning: Missing segment or carbon data for route '{route_name}'. Skipping breakdown.")
+def build_carbon_pivot(routes):
+    """Builds the one-way carbon breakdown table used by the breakdown plots.
 
-    if not carbon_breakdown:
-        print("Skipping carbon breakdown plot: No data available.")
-        plt.close()
-        return
+    Args:
+        routes (dict): Dictionary containing route data with calculated metrics.
 
-    df_breakdown = pd.DataFrame(carbon_breakdown)
+    Returns:
+        pd.DataFrame: Carbon (kg CO2e) with one row per route and one column per
+            transport mode; empty if no route has carbon data.
+    """
+    # One preallocated array per column, sized for every segment
+    n = sum(len(route_data['segments']) for route_data in routes.values() if 'segments' in route_data)
+    route_arr = np.empty(n, dtype=object)
+    mode_arr = np.empty(n, dtype=object)
+    carbon_arr = np.empty(n, dtype=np.float64)
 
-    # Pivot for stacked bars
-    pivot_df = df_breakdown.pivot_table(index='Route', columns='Mode', values='Carbon (kg CO2e)', aggfunc='sum')
-    pivot_df.fillna(0, inplace=True)
+    i = 0
+    for route_name, route_data in routes.items():
+        # Copy segments in a single pass; a segment without carbon data discards the whole route
+        route_start = i
+        complete = 'segments' in route_data
+        for segment in route_data.get('segments', ()):
+            if 'carbon' not in segment:
+                complete = False
+                break
+            route_arr[i] = route_name
+            mode_arr[i] = segment['mode']
+            carbon_arr[i] = segment['carbon'] # One-way carbon
+            i += 1
+        if not complete:
+            i = route_start
+            print(f"Warning: Missing segment or carbon data for route '{route_name}'. Skipping breakdown.")
 
+    if i == 0:
+        return pd.DataFrame()
+
+    # Skipped routes leave unused slots at the end of the arrays
+    df_breakdown = pd.DataFrame({'Route': route_arr[:i],
+                                 'Mode': mode_arr[:i],
+                                 'Carbon (kg CO2e)': carbon_arr[:i]}, copy=False)
+
+    # Pivot for stacked bars (routes as rows, modes as columns)
+    return df_breakdown.groupby(['Route', 'Mode'])['Carbon (kg CO2e)'].sum().unstack('Mode', fill_value=0)
+
+def _plot_breakdown_on_ax(ax, pivot_df, colors):
+    """Draws the stacked carbon breakdown bars of `pivot_df` on `ax`."""
+    pivot_df.plot(kind='bar', stacked=True, ax=ax, color=colors)
+    ax.set_title('Carbon Footprint Breakdown by Transport Mode (One-Way)', fontsize=16)
+    ax.set_ylabel('Carbon Footprint (kg CO2e)', fontsize=14)
+    ax.set_xlabel('Route', fontsize=14)
+    ax.legend(title='Transport Mode')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
+    ax.tick_params(axis='x', rotation=0)
+
+def plot_carbon_breakdown(pivot_df, fig=None):
+    """Plots the carbon footprint breakdown by transport mode."""
+    fig, owns_fig = _get_figure(fig, (14, 10))
     if pivot_df.empty:
-        print("Skipping carbon breakdown plot: Pivot table is empty.")
-        plt.close()
+        print("Skipping carbon breakdown plot: No data available.")
+        _release_figure(fig, owns_fig)
         return
 
     # Plot stacked bar chart
-    ax = pivot_df.plot(kind='bar', stacked=True, figsize=(14, 10),
-                      color=['#fdcb6e', '#0984e3', '#00b894', '#6c5ce7', '#e17055', '#fab1a0']) # Added more colors
-    plt.title('Carbon Footprint Breakdown by Transport Mode (One-Way)', fontsize=16)
-    plt.ylabel('Carbon Footprint (kg CO2e)', fontsize=14)
-    plt.xlabel('Route', fontsize=14)
-    plt.legend(title='Transport Mode')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.xticks(rotation=0)
-    plt.gca().yaxis.set_major_formatter(ticker.FuncFormatter(format_thousands))
+    ax = fig.add_subplot(111)
+    _plot_breakdown_on_ax(ax, pivot_df, MODE_PALETTE)
     plt.tight_layout()
     save_path = os.path.join(VIZ_DIR, 'carbon_breakdown.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_current_figure(save_path)
     print(f"Plot saved: {save_path}")
-    plt.close()
+    _release_figure(fig, owns_fig)
 
-def create_dashboard(df_results, routes):
+def create_dashboard(feasible_df, feasible_unique_df, pivot_df):
     """Creates a summary dashboard with multiple plots."""
     fig = plt.figure(figsize=(20, 24))
     gs = fig.add_gridspec(3, 2, hspace=0.5, wspace=0.3)
 
     # Data subsets
-    feasible_results = df_results[df_results['Feasibility'] == 'Feasible']
-    if feasible_results.empty:
+    if feasible_df.empty:
         print("Skipping dashboard creation: No feasible data.")
         plt.close(fig)
         return
 
-    carbon_data = feasible_results.drop_duplicates(subset=['Route', 'Scenario'])
-    carbon_per_day_data = feasible_results[feasible_results['Carbon per Vacation Day'].notna()].drop_duplicates(subset=['Route', 'Scenario'])
-    time_data = feasible_results.drop_duplicates(subset=['Route', 'Scenario'])
-    cost_data_hostel = feasible_results[feasible_results['Accommodation'] == 'Hostel']
+    carbon_data = feasible_unique_df
+    carbon_per_day_data = feasible_unique_df.dropna(subset=['Carbon per Vacation Day'])
+    time_data = feasible_unique_df
+    cost_data_hostel = feasible_df[feasible_df['Accommodation'] == 'Hostel']
 
     # --- Plot 1: Carbon footprint comparison ---
     ax1 = fig.add_subplot(gs[0, 0])
     if not carbon_data.empty:
         sns.barplot(x='Route', y='Carbon Footprint (kg CO2e)',
                    hue='Scenario', data=carbon_data,
-                   palette=['#ff7675', '#74b9ff'], ax=ax1)
+                   palette=SCENARIO_PALETTE, ax=ax1)
         ax1.set_title('Carbon Footprint by Route and Scenario', fontsize=16)
         ax1.set_ylabel('Carbon Footprint (kg CO2e)', fontsize=14)
         ax1.set_xlabel('') # Remove x-label for cleaner look
         ax1.grid(axis='y', linestyle='--', alpha=0.7)
         ax1.legend(title='Scenario')
-        ax1.yaxis.set_major_formatter(ticker.FuncFormatter(format_thousands))
+        ax1.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
         ax1.tick_params(axis='x', rotation=10)
     else:
         ax1.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
@@ -225,7 +313,7 @@ def create_dashboard(df_results, routes):
     if not carbon_per_day_data.empty:
         sns.barplot(x='Route', y='Carbon per Vacation Day',
                    hue='Scenario', data=carbon_per_day_data,
-                   palette=['#ff7675', '#74b9ff'], ax=ax2)
+                   palette=SCENARIO_PALETTE, ax=ax2)
         ax2.set_title('Carbon Footprint per Vacation Day', fontsize=16)
         ax2.set_ylabel('kg CO2e per Day at Destination', fontsize=14)
         ax2.set_xlabel('') # Remove x-label
@@ -248,7 +336,8 @@ def create_dashboard(df_results, routes):
         ax3.set_title('Time Distribution: Travel vs. Destination', fontsize=16)
         ax3.set_ylabel('Days', fontsize=14)
         ax3.set_xticks(time_indices)
-        ax3.set_xticklabels([f"{row['Route']}\n({row['Scenario']})" for _, row in time_data.iterrows()], rotation=45, ha='right')
+        tick_labels = (time_data['Route'].astype(str) + '\n(' + time_data['Scenario'].astype(str) + ')').tolist()
+        ax3.set_xticklabels(tick_labels, rotation=45, ha='right')
         ax3.legend()
         ax3.grid(axis='y', linestyle='--', alpha=0.7)
     else:
@@ -260,13 +349,13 @@ def create_dashboard(df_results, routes):
     if not cost_data_hostel.empty:
         sns.barplot(x='Route', y='Total Cost (EUR)',
                    hue='Scenario', data=cost_data_hostel,
-                   palette=['#ff7675', '#74b9ff'], ax=ax4)
+                   palette=SCENARIO_PALETTE, ax=ax4)
         ax4.set_title('Total Cost Comparison (Hostel)', fontsize=16)
         ax4.set_ylabel('Total Cost (EUR)', fontsize=14)
         ax4.set_xlabel('') # Remove x-label
         ax4.grid(axis='y', linestyle='--', alpha=0.7)
         ax4.legend(title='Scenario')
-        ax4.yaxis.set_major_formatter(ticker.FuncFormatter(format_thousands))
+        ax4.yaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
         ax4.tick_params(axis='x', rotation=10)
     else:
         ax4.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
@@ -274,33 +363,8 @@ def create_dashboard(df_results, routes):
 
     # --- Plot 5: Carbon breakdown ---
     ax5 = fig.add_subplot(gs[2, :])
-    carbon_breakdown = []
-    for route_name, route_data in routes.items():
-        if 'segments' in route_data and all('carbon' in seg for seg in route_data['segments']):
-            for segment in route_data['segments']:
-                carbon_breakdown.append({
-                    'Route': route_name,
-                    'Mode': segment['mode'],
-                    'Carbon (kg CO2e)': segment['carbon']
-                })
-
-    if carbon_breakdown:
-        df_breakdown = pd.DataFrame(carbon_breakdown)
-        pivot_df = df_breakdown.pivot_table(index='Route', columns='Mode', values='Carbon (kg CO2e)', aggfunc='sum')
-        pivot_df.fillna(0, inplace=True)
-        if not pivot_df.empty:
-            pivot_df.plot(kind='bar', stacked=True, ax=ax5, figsize=(14, 8),
-                         color=['#fdcb6e', '#0984e3', '#00b894', '#6c5ce7', '#e17055', '#fab1a0'])
-            ax5.set_title('Carbon Footprint Breakdown by Transport Mode (One-Way)', fontsize=16)
-            ax5.set_ylabel('Carbon Footprint (kg CO2e)', fontsize=14)
-            ax5.set_xlabel('Route', fontsize=14)
-            ax5.legend(title='Transport Mode')
-            ax5.grid(axis='y', linestyle='--', alpha=0.7)
-            ax5.yaxis.set_major_formatter(ticker.FuncFormatter(format_thousands))
-            ax5.tick_params(axis='x', rotation=0)
-        else:
-             ax5.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
-             ax5.set_title('Carbon Footprint Breakdown by Transport Mode (One-Way)', fontsize=16)
+    if not pivot_df.empty:
+        _plot_breakdown_on_ax(ax5, pivot_df, MODE_PALETTE)
     else:
         ax5.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
         ax5.set_title('Carbon Footprint Breakdown by Transport Mode (One-Way)', fontsize=16)
@@ -308,31 +372,52 @@ def create_dashboard(df_results, routes):
     plt.suptitle('Eco-Friendly Travel Analysis: Grenoble to Abuja', fontsize=24, y=1.02)
     plt.tight_layout(rect=[0, 0, 1, 0.99]) # Adjust rect to prevent suptitle overlap
     save_path = os.path.join(VIZ_DIR, 'eco_travel_dashboard.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_current_figure(save_path)
     print(f"Dashboard saved: {save_path}")
     plt.close(fig)
 
+# Figure reused by all plots rendered in the current worker process
+_worker_figure = None
+
+def _render_in_worker(plot_func, *args):
+    """Runs `plot_func` in a pool worker, drawing on the worker's shared figure."""
+    global _worker_figure
+    if _worker_figure is None:
+        _worker_figure = plt.figure()
+    plot_func(*args, fig=_worker_figure)
+
 def generate_all_visualizations(df_results, routes):
     """Generates all standard visualizations."""
-    setup_visualization_directory() # Ensure the output directory is ready
     print("\nGenerating visualizations...")
     setup_visualization_directory() # Ensure directory is clean
 
-    # Set global plot styles
-    sns.set_style("whitegrid")
-    plt.rcParams['font.family'] = 'DejaVu Sans'
-    plt.rcParams['font.size'] = 12
-
-    # Generate individual plots
-    plot_carbon_footprint_comparison(df_results)
-    plot_carbon_per_vacation_day(df_results)
-    plot_time_distribution(df_results)
-    plot_cost_comparison(df_results, accommodation_type='Hostel') # Example with Hostel
-    plot_cost_comparison(df_results, accommodation_type='Hotel')  # Example with Hotel
-    plot_cost_comparison(df_results, accommodation_type='Airbnb') # Example with Airbnb
-    plot_carbon_breakdown(routes)
+    feasible_df, feasible_unique_df = split_feasible_results(df_results)
+    pivot_df = build_carbon_pivot(routes)
+
+    # Generate individual plots; they share no state, so they can render in separate processes
+    plot_jobs = [
+        (plot_carbon_footprint_comparison, (feasible_unique_df,)),
+        (plot_carbon_per_vacation_day, (feasible_unique_df,)),
+        (plot_time_distribution, (feasible_unique_df,)),
+        (plot_cost_comparison, (feasible_df, 'Hostel')), # Example with Hostel
+        (plot_cost_comparison, (feasible_df, 'Hotel')),  # Example with Hotel
+        (plot_cost_comparison, (feasible_df, 'Airbnb')), # Example with Airbnb
+        (plot_carbon_breakdown, (pivot_df,)),
+    ]
+    max_workers = min(len(plot_jobs), os.cpu_count() or 1)
+    if max_workers == 1:
+        # A single worker gains nothing over rendering here, so skip the pool start-up
+        fig = plt.figure()
+        for plot_func, args in plot_jobs:
+            plot_func(*args, fig=fig)
+        plt.close(fig)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_render_in_worker, plot_func, *args) for plot_func, args in plot_jobs]
+            for future in futures:
+                future.result() # Re-raise any error from the worker
 
     # Generate dashboard
-    create_dashboard(df_results, routes)
+    create_dashboard(feasible_df, feasible_unique_df, pivot_df)
 
     print("Visualization generation complete.")
\ No newline at end of file
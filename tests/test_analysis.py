@@ -2,6 +2,7 @@
 Tests for the analysis calculations.
 """
 
+import copy
 import pytest
 import sys
 import os
@@ -15,11 +16,13 @@ sys.path.insert(0, project_root)
 # Import functions to test and constants for haversine
 from src.app.calculations.analysis import (
     haversine,
+    haversine_array,
     calculate_route_metrics,
     analyze_scenarios,
-    generate_key_findings
+    generate_key_findings,
+    Findings
 )
-from src.app.data.constants import GRENOBLE_COORDS, ABUJA_COORDS
+from src.app.data.constants import GRENOBLE_COORDS, ABUJA_COORDS, ROUTES, CARBON_EMISSIONS, ACCOMMODATION, SCENARIOS
 
 # --- Mock Data for Testing ---
 
@@ -58,6 +61,10 @@ MOCK_SCENARIOS = {
     '1-month': {'days': 30}
 }
 
+def fresh_routes():
+    """Returns a deep copy of MOCK_ROUTES, since route metrics are written into it."""
+    return copy.deepcopy(MOCK_ROUTES)
+
 # --- Haversine Tests (Existing) ---
 
 def test_haversine_grenoble_abuja():
@@ -75,13 +82,21 @@ def test_haversine_same_point():
                          GRENOBLE_COORDS[0], GRENOBLE_COORDS[1])
     assert distance == pytest.approx(0.0), "Distance between the same point should be zero."
 
+def test_haversine_array_matches_scalar():
+    """Tests that the vectorized haversine agrees with the scalar version."""
+    lat1 = np.array([GRENOBLE_COORDS[0], GRENOBLE_COORDS[0]])
+    lon1 = np.array([GRENOBLE_COORDS[1], GRENOBLE_COORDS[1]])
+    lat2 = np.array([ABUJA_COORDS[0], GRENOBLE_COORDS[0]])
+    lon2 = np.array([ABUJA_COORDS[1], GRENOBLE_COORDS[1]])
+    distances = haversine_array(lat1, lon1, lat2, lon2)
+    expected = [haversine(*args) for args in zip(lat1, lon1, lat2, lon2)]
+    assert distances == pytest.approx(expected)
+
 # --- New Tests for Core Analysis Functions ---
 
 def test_calculate_route_metrics():
     """Tests the calculation of distance and carbon footprint for routes."""
-    routes_copy = {k: v.copy() for k, v in MOCK_ROUTES.items()} # Work on a copy
-    routes_copy['FastAir']['segments'] = [s.copy() for s in routes_copy['FastAir']['segments']]
-    routes_copy['SlowLand']['segments'] = [s.copy() for s in routes_copy['SlowLand']['segments']]
+    routes_copy = fresh_routes() # Work on a copy
 
     calculated_routes = calculate_route_metrics(routes_copy, MOCK_CARBON_EMISSIONS)
 
@@ -100,12 +115,37 @@ def test_calculate_route_metrics():
     assert calculated_routes['SlowLand']['total_carbon_one_way'] == pytest.approx(train_carbon + bus_carbon)
     assert calculated_routes['SlowLand']['total_carbon_round_trip'] == pytest.approx((train_carbon + bus_carbon) * 2)
 
+def test_calculate_route_metrics_default_routes():
+    """Tests that the default routes get per-segment carbon from the default emissions table."""
+    routes_copy = copy.deepcopy(ROUTES)
+
+    calculated_routes = calculate_route_metrics(routes_copy, CARBON_EMISSIONS)
+
+    for route_data in calculated_routes.values():
+        for segment in route_data['segments']:
+            expected = segment['distance'] * CARBON_EMISSIONS[segment['mode']] / 1000
+            assert segment['carbon'] == pytest.approx(expected, rel=1e-6)
+        assert route_data['total_distance'] == sum(s['distance'] for s in route_data['segments'])
+        assert route_data['total_carbon_one_way'] == pytest.approx(sum(s['carbon'] for s in route_data['segments']))
+
+def test_calculate_route_metrics_edited_emissions(monkeypatch):
+    """Tests that in-place edits to the default emissions table are picked up."""
+    monkeypatch.setitem(CARBON_EMISSIONS, 'Plane', 100)
+    monkeypatch.setitem(CARBON_EMISSIONS, 'Tram', 5)
+    routes_copy = copy.deepcopy(ROUTES)
+    routes_copy['Tram Hop'] = {'segments': [{'mode': 'Tram', 'distance': 10}], 'travel_time_hours': 1, 'cost_eur': 10}
+
+    calculated_routes = calculate_route_metrics(routes_copy, CARBON_EMISSIONS)
+
+    for route_data in calculated_routes.values():
+        for segment in route_data['segments']:
+            expected = segment['distance'] * CARBON_EMISSIONS[segment['mode']] / 1000
+            assert segment['carbon'] == pytest.approx(expected, rel=1e-6)
+
 def test_analyze_scenarios():
     """Tests the scenario analysis for feasibility, cost, and time."""
     # First, calculate metrics needed by analyze_scenarios
-    routes_copy = {k: v.copy() for k, v in MOCK_ROUTES.items()}
-    routes_copy['FastAir']['segments'] = [s.copy() for s in routes_copy['FastAir']['segments']]
-    routes_copy['SlowLand']['segments'] = [s.copy() for s in routes_copy['SlowLand']['segments']]
+    routes_copy = fresh_routes()
     routes_with_metrics = calculate_route_metrics(routes_copy, MOCK_CARBON_EMISSIONS)
 
     df_results = analyze_scenarios(routes_with_metrics, MOCK_ACCOMMODATION, MOCK_SCENARIOS)
@@ -146,6 +186,27 @@ def test_analyze_scenarios():
     assert month_land_hotel['Total Cost (EUR)'] == pytest.approx(600 + days_dest_land * 90)
     assert month_land_hotel['Carbon per Vacation Day'] == pytest.approx(routes_with_metrics['SlowLand']['total_carbon_round_trip'] / days_dest_land)
 
+def test_analyze_scenarios_default_tables():
+    """Tests that the default accommodation and scenario tables give the same results as equal copies."""
+    routes_with_metrics = calculate_route_metrics(copy.deepcopy(ROUTES), CARBON_EMISSIONS)
+
+    df_constants = analyze_scenarios(routes_with_metrics, ACCOMMODATION, SCENARIOS)
+    df_copies = analyze_scenarios(routes_with_metrics, dict(ACCOMMODATION), copy.deepcopy(SCENARIOS))
+
+    pd.testing.assert_frame_equal(df_constants, df_copies)
+
+def test_analyze_scenarios_edited_default_tables(monkeypatch):
+    """Tests that in-place edits to the default accommodation and scenario tables are picked up."""
+    monkeypatch.setitem(ACCOMMODATION, 'Camping', 10)
+    monkeypatch.setitem(SCENARIOS, '2-month', {'days': 60})
+    routes_with_metrics = calculate_route_metrics(copy.deepcopy(ROUTES), CARBON_EMISSIONS)
+
+    df_results = analyze_scenarios(routes_with_metrics, ACCOMMODATION, SCENARIOS)
+
+    assert len(df_results) == len(SCENARIOS) * len(ROUTES) * len(ACCOMMODATION)
+    assert list(df_results['Accommodation'].cat.categories) == list(ACCOMMODATION)
+    assert list(df_results['Scenario'].cat.categories) == list(SCENARIOS)
+
 def test_generate_key_findings_no_feasible():
     """Tests key findings generation when no options are feasible."""
     df_empty = pd.DataFrame(columns=['Scenario', 'Route', 'Accommodation', 'Feasibility'])
@@ -154,21 +215,21 @@ def test_generate_key_findings_no_feasible():
     findings_empty = generate_key_findings(df_empty)
     findings_not_feasible = generate_key_findings(df_not_feasible)
 
-    assert findings_empty == ["No feasible travel options found for the given scenarios."]
-    assert findings_not_feasible == ["No feasible travel options found for the given scenarios."]
+    assert findings_empty.lines == ["No feasible travel options found for the given scenarios."]
+    assert findings_not_feasible.lines == ["No feasible travel options found for the given scenarios."]
+    assert findings_empty.recommendations == []
 
 def test_generate_key_findings_with_data():
     """Tests key findings generation with the mock data results."""
     # Generate results from mock data first
-    routes_copy = {k: v.copy() for k, v in MOCK_ROUTES.items()}
-    routes_copy['FastAir']['segments'] = [s.copy() for s in routes_copy['FastAir']['segments']]
-    routes_copy['SlowLand']['segments'] = [s.copy() for s in routes_copy['SlowLand']['segments']]
+    routes_copy = fresh_routes()
     routes_with_metrics = calculate_route_metrics(routes_copy, MOCK_CARBON_EMISSIONS)
     df_results = analyze_scenarios(routes_with_metrics, MOCK_ACCOMMODATION, MOCK_SCENARIOS)
 
-    findings = generate_key_findings(df_results)
+    key_findings = generate_key_findings(df_results)
+    findings = key_findings.lines
 
-    assert isinstance(findings, list)
+    assert isinstance(key_findings, Findings)
     assert len(findings) > 5 # Expect multiple findings
 
     # Check specific findings based on mock data
@@ -185,4 +246,7 @@ def test_generate_key_findings_with_data():
     assert any("1-month: 'SlowLand' at approximately €1080" in f for f in findings)
     # Check recommendations
     assert any("1-week vacation: 'FastAir'" in f for f in findings)
-    assert any("1-month vacation: 'SlowLand'" in f for f in findings)
\ No newline at end of file
+    assert any("1-month vacation: 'SlowLand'" in f for f in findings)
+    assert key_findings.recommendations[0].startswith("1-week vacation: 'FastAir'")
+    assert key_findings.week_routes == ['FastAir']
+    assert key_findings.month_best == 'SlowLand'
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Tests for the visualization helpers.
+"""
+
+import copy
+import sys
+import os
+import matplotlib.pyplot as plt
+
+# Add project root to sys.path to allow imports from 'src'
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.app.calculations.analysis import calculate_route_metrics, analyze_scenarios
+from src.app.data.constants import ROUTES, CARBON_EMISSIONS, ACCOMMODATION, SCENARIOS
+from src.app.visualization import plotting
+from src.app.visualization.plotting import split_feasible_results, plot_cost_comparison
+
+def default_results():
+    """Returns the scenario analysis of the default data."""
+    routes_with_metrics = calculate_route_metrics(copy.deepcopy(ROUTES), CARBON_EMISSIONS)
+    return analyze_scenarios(routes_with_metrics, ACCOMMODATION, SCENARIOS)
+
+def test_split_feasible_results_drops_unused_categories():
+    """Tests that routes and scenarios with no feasible rows are not kept as categories."""
+    df_results = default_results()
+    week_results = df_results[df_results['Scenario'] == '1-week']
+
+    feasible_df, feasible_unique_df = split_feasible_results(week_results)
+
+    for df in (feasible_df, feasible_unique_df):
+        assert set(df['Route'].cat.categories) == set(df['Route'])
+        assert set(df['Scenario'].cat.categories) == set(df['Scenario'])
+
+def test_plot_cost_comparison_shows_only_present_values(tmp_path, monkeypatch):
+    """Tests that the cost plot has no empty slots for routes or scenarios without data."""
+    monkeypatch.setattr(plotting, 'VIZ_DIR', str(tmp_path))
+    feasible_df, _ = split_feasible_results(default_results())
+    week_df = feasible_df[feasible_df['Scenario'] == '1-week']
+    fig = plt.figure()
+
+    plot_cost_comparison(week_df, accommodation_type='Hostel', fig=fig)
+
+    ax = fig.axes[0]
+    week_routes = sorted(set(week_df['Route']))
+    assert sorted(label.get_text() for label in ax.get_xticklabels()) == week_routes
+    assert len(week_routes) < len(ROUTES) # Some default routes are too slow for one week
+    assert [text.get_text() for text in ax.get_legend().get_texts()] == ['1-week']
+    assert (tmp_path / 'cost_comparison_hostel.png').exists()
+    plt.close(fig)